@@ -0,0 +1,15 @@
+"""JSON decoding backend for the parsers.
+
+Uses orjson when installed (the ``speedups`` extra) and the standard
+library otherwise. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+so callers catch the stdlib exception either way.
+"""
+
+from __future__ import annotations
+
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - depends on optional dependency
+    from json import loads  # type: ignore[assignment,unused-ignore]
+
+__all__ = ["loads"]
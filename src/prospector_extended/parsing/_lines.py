@@ -0,0 +1,64 @@
+r"""Line iteration for tool output buffers.
+
+Lines end at "\n" only, as in JSON Lines. Splitting a very large output whole
+builds every line up front and roughly doubles peak memory, so above
+STREAM_THRESHOLD characters the buffer is split one bounded chunk at a time,
+with the same line boundaries. Callers that already have a line source (e.g.
+a stream) can pass it through as is.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+# Outputs at least this long (in characters) are scanned rather than split
+STREAM_THRESHOLD = 1 << 20
+
+# Large outputs are split this many characters at a time, each chunk extended
+# to the next newline so no line (nor a \r\n pair) straddles two chunks
+_CHUNK_SIZE = 1 << 16
+
+
+def iter_lines(text: str | Iterable[str]) -> Iterator[str]:
+    r"""Iterate over the lines of text without line terminators.
+
+    Lines end at "\n" only, with one trailing "\r" dropped (JSON Lines
+    semantics): other characters str.splitlines() treats as breaks, such as
+    U+2028, may appear raw inside JSON strings.
+
+    Args:
+        text: Complete tool output, or an iterable of lines such as an open
+            text stream (lines may keep their terminators).
+
+    Returns:
+        Iterator over lines.
+    """
+    if not isinstance(text, str):
+        return (line.rstrip("\r\n") for line in text)
+    if len(text) < STREAM_THRESHOLD:
+        return iter(_split_lines(text))
+    return _scan_lines(text)
+
+
+def _split_lines(text: str) -> list[str]:
+    r"""Split text on "\n", dropping one trailing "\r" per line and a final empty line."""
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+
+def _scan_lines(text: str) -> Iterator[str]:
+    r"""Yield lines by splitting text one newline-terminated chunk at a time.
+
+    Only one chunk's lines exist at once, and since every chunk but the last
+    ends in "\n", lines break exactly as they would for the whole buffer.
+    """
+    find = text.find
+    end = len(text)
+    start = 0
+    while start < end:
+        stop = find("\n", start + _CHUNK_SIZE)
+        stop = end if stop < 0 else stop + 1
+        yield from _split_lines(text[start:stop])
+        start = stop
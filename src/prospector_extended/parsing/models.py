@@ -6,11 +6,16 @@ schema generation. The fingerprints are used for drift detection.
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
 import re
+from collections.abc import Iterable
 from typing import Literal
 
-from pydantic import BaseModel, field_validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+
+from prospector_extended.parsing._lines import iter_lines
 
 # =============================================================================
 # MYPY OUTPUT MODELS
@@ -23,6 +28,12 @@ class MypyJsonOutput(BaseModel):
     The JSON output format is documented in mypy PR #11396.
     """
 
+    # Instances are frozen: parsed records are shared (e.g. by the cached text
+    # parser) and never modified after parsing. Unknown keys from newer mypy
+    # versions are ignored. (A comment, not docstring text: the docstring is
+    # the schema description and so feeds the schema fingerprint.)
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     file: str
     line: int  # 1-indexed
     column: int  # 0-indexed
@@ -44,16 +55,57 @@ class MypyJsonOutput(BaseModel):
         return max(0, v) if v else 0
 
 
+class MypyRecord(msgspec.Struct):
+    """Fast-path decode target mirroring MypyJsonOutput.
+
+    mypy's JSON output is a trusted, fixed schema, so records are decoded
+    with msgspec and handed out as MypyJsonOutput via model_construct.
+    Records that don't decode cleanly fall back to Pydantic validation.
+    """
+
+    file: str
+    line: int
+    column: int
+    message: str
+    severity: Literal["error", "note"]
+    hint: str | None = None
+    code: str | None = None
+
+    def to_output(self) -> MypyJsonOutput:
+        """Convert to MypyJsonOutput, applying the model's line/column clamps."""
+        return MypyJsonOutput.model_construct(
+            file=self.file,
+            line=max(1, self.line),
+            column=max(0, self.column),
+            message=self.message,
+            hint=self.hint,
+            code=self.code,
+            severity=self.severity,
+        )
+
+
+_MYPY_DECODER = msgspec.json.Decoder(MypyRecord)
+
+
 # Known fingerprint for mypy schema - update when schema changes intentionally
 # This is computed from the JSON Schema representation of MypyJsonOutput
 MYPY_SCHEMA_FINGERPRINT = "da92ebf2ae80d1f9"
 
 
-def get_mypy_json_schema() -> dict[str, object]:
-    """Get the JSON Schema for mypy output."""
+@functools.cache
+def _build_mypy_json_schema() -> dict[str, object]:
+    """Generate the mypy JSON Schema once per process."""
     return MypyJsonOutput.model_json_schema()
 
 
+def get_mypy_json_schema() -> dict[str, object]:
+    """Get the JSON Schema for mypy output.
+
+    Returns a fresh copy of the cached schema so callers may mutate it.
+    """
+    return copy.deepcopy(_build_mypy_json_schema())
+
+
 # =============================================================================
 # MYPY TEXT FALLBACK PARSER
 # =============================================================================
@@ -62,13 +114,26 @@ def get_mypy_json_schema() -> dict[str, object]:
 # Or: file:line: severity: message [code] (without column)
 _MYPY_TEXT_PATTERN = re.compile(r"^(.+?):(\d+):(?:(\d+):)?\s*(error|warning|note):\s*(.+?)(?:\s*\[([^\]]+)\])?$")
 
+# Summary and status lines in stdout that never carry a diagnostic.
+# Checked with str.startswith before the pattern: folding these into the
+# pattern as a leading alternation measured slower for both diagnostic and
+# summary lines.
+_MYPY_SKIP_PREFIXES = ("Found ", "Success:", "mypy:", "error:", "note:")
+
+# mypy-level (not per-file) errors reported on stderr
+_MYPY_STDERR_PREFIXES = ("mypy:", "error:")
+
 
+@functools.lru_cache(maxsize=4096)
 def parse_mypy_text_line(line: str) -> MypyJsonOutput | None:
     """Parse mypy's text output format as fallback.
 
     Mypy outputs text format for syntax errors even with --output json.
     This parser handles those cases.
 
+    Results are cached per line, so repeated lines return the same
+    (frozen) instance.
+
     Args:
         line: A line of mypy output.
 
@@ -76,7 +141,7 @@ def parse_mypy_text_line(line: str) -> MypyJsonOutput | None:
         Parsed MypyJsonOutput if line matches, None otherwise.
     """
     # Skip summary and status lines
-    if line.startswith(("Found ", "Success:", "mypy:", "error:", "note:")):
+    if line.startswith(_MYPY_SKIP_PREFIXES):
         return None
 
     if not (match := _MYPY_TEXT_PATTERN.match(line)):
@@ -104,7 +169,7 @@ def parse_mypy_text_line(line: str) -> MypyJsonOutput | None:
 # =============================================================================
 
 
-def parse_mypy_output(stdout: str, stderr: str = "") -> list[MypyJsonOutput]:
+def parse_mypy_output(stdout: str | Iterable[str], stderr: str = "") -> list[MypyJsonOutput]:
     """Parse mypy output into validated MypyJsonOutput objects.
 
     Handles:
@@ -113,7 +178,8 @@ def parse_mypy_output(stdout: str, stderr: str = "") -> list[MypyJsonOutput]:
     - stderr messages (file not found, etc.)
 
     Args:
-        stdout: The stdout from mypy.
+        stdout: The stdout from mypy, as one string or an iterable of lines
+            (e.g. a text stream), which is consumed lazily.
         stderr: The stderr from mypy.
 
     Returns:
@@ -121,37 +187,45 @@ def parse_mypy_output(stdout: str, stderr: str = "") -> list[MypyJsonOutput]:
     """
     results: list[MypyJsonOutput] = []
 
-    for line in stdout.strip().split("\n"):
+    # Single pass over stdout, split on "\n" only: messages may contain
+    # U+2028, \x85 and other characters str.splitlines() would break on
+    for line in iter_lines(stdout):
         if not line:
             continue
 
-        # JSON path (preferred)
-        if line.startswith("{"):
+        # JSON path (preferred); a line that isn't brace-delimited can't be a
+        # JSON object, so it goes straight to the text parser without paying
+        # for two failed decode attempts
+        if line[0] == "{" and line[-1] == "}":
+            try:
+                results.append(_MYPY_DECODER.decode(line).to_output())
+                continue
+            except msgspec.DecodeError:
+                pass  # Fall back to Pydantic validation
+
             try:
-                data = json.loads(line)
-                results.append(MypyJsonOutput.model_validate(data))
+                # Parsed and validated in one pass by pydantic-core
+                results.append(MypyJsonOutput.model_validate_json(line))
                 continue
-            except (json.JSONDecodeError, ValueError):
+            except ValidationError:
                 pass  # Fall through to text parser
 
         # Text path (fallback)
         if parsed := parse_mypy_text_line(line):
             results.append(parsed)
 
-    # Handle stderr (mypy-level errors)
-    for line in stderr.strip().split("\n"):
-        if not line:
-            continue
-        if line.startswith("mypy:") or line.startswith("error:"):
-            results.append(
-                MypyJsonOutput(
-                    file="",
-                    line=1,
-                    column=0,
-                    message=line,
-                    code="mypy-error",
-                    severity="error",
-                )
-            )
+    # Handle stderr (mypy-level errors); blank lines fail the prefix check
+    results.extend(
+        MypyJsonOutput(
+            file="",
+            line=1,
+            column=0,
+            message=line,
+            code="mypy-error",
+            severity="error",
+        )
+        for line in iter_lines(stderr)
+        if line.startswith(_MYPY_STDERR_PREFIXES)
+    )
 
     return results
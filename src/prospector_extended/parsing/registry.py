@@ -11,15 +11,21 @@ Inspired by cattrs structure hooks, YAML tags, and Pydantic discriminated unions
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft7Validator
+import fastjsonschema
+
+from prospector_extended.parsing import _json
+from prospector_extended.parsing._lines import iter_lines
 
 # =============================================================================
 # SCHEMA DEFINITION
@@ -32,22 +38,42 @@ class RegisteredSchema:
 
     name: str
     schema: dict[str, Any]
-    fingerprint: str
+    fingerprint: str = ""  # Computed from the schema when empty
     matcher: SchemaMatcher | None = None
-
-    _validator: Draft7Validator = field(init=False, repr=False)
+    skip_validation: bool = False  # Trust the matcher; don't validate matched records
 
     def __post_init__(self) -> None:
-        """Initialize the JSON Schema validator."""
-        self._validator = Draft7Validator(self.schema)
+        """Fill in the fingerprint if one wasn't supplied."""
+        if not self.fingerprint:
+            self.fingerprint = compute_fingerprint(self.schema)
+
+    @cached_property
+    def _validator(self) -> Callable[[Any], Any]:
+        """Compile the JSON Schema on first use.
+
+        Schemas that are only loaded for drift checking never pay for it.
+        """
+        # use_default=False: validation must never write schema defaults into parsed data
+        # use_formats=False: "format" is an annotation (as with Draft7Validator), not an
+        # assertion; pydantic emits date-time for datetime fields, which accept naive values
+        validator: Callable[[Any], Any] = fastjsonschema.compile(self.schema, use_default=False, use_formats=False)
+        return validator
 
     def validate(self, data: dict[str, Any]) -> list[str]:
-        """Return validation errors (empty list means valid)."""
-        return [e.message for e in self._validator.iter_errors(data)]
+        """Return validation errors (empty list means valid).
+
+        The compiled validator stops at the first error, so at most one
+        message is returned.
+        """
+        try:
+            self._validator(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return [e.message]
+        return []
 
     def is_valid(self, data: dict[str, Any]) -> bool:
         """Quick check if data validates against this schema."""
-        return bool(self._validator.is_valid(data))
+        return not self.validate(data)
 
 
 # =============================================================================
@@ -108,11 +134,16 @@ class RequiredFieldsMatcher(SchemaMatcher):
     required_fields: frozenset[str]
     forbidden_fields: frozenset[str] = field(default_factory=frozenset)
 
+    def __post_init__(self) -> None:
+        """Accept any iterable of field names; the key-view checks need sets."""
+        self.required_fields = frozenset(self.required_fields)
+        self.forbidden_fields = frozenset(self.forbidden_fields)
+
     def matches(self, data: dict[str, Any]) -> bool:
         """Check if data has all required fields and no forbidden fields."""
-        has_required = all(f in data for f in self.required_fields)
-        has_forbidden = any(f in data for f in self.forbidden_fields)
-        return has_required and not has_forbidden
+        # Key-view set operations run the membership loops in C
+        keys = data.keys()
+        return keys >= self.required_fields and keys.isdisjoint(self.forbidden_fields)
 
     def priority(self) -> int:
         """Medium priority - structural matching."""
@@ -151,8 +182,11 @@ class AlwaysMatcher(SchemaMatcher):
 # PARSE RESULTS
 # =============================================================================
 
+# One result is allocated per parsed line, so results are slotted. They are
+# not frozen: frozen dataclass construction measured nearly twice as slow.
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedRecord:
     """Successfully parsed and validated record."""
 
@@ -161,7 +195,7 @@ class ParsedRecord:
     raw: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UnparsedLine:
     """Line that couldn't be parsed as JSON."""
 
@@ -169,7 +203,7 @@ class UnparsedLine:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationFailure:
     """JSON parsed but failed validation against all schemas."""
 
@@ -180,6 +214,17 @@ class ValidationFailure:
 
 ParseResult = ParsedRecord | UnparsedLine | ValidationFailure
 
+# (position in priority order, schema) - position keeps merged candidates in order
+_RankedSchema = tuple[int, RegisteredSchema]
+# (schemas indexed under one key, full candidate list when only that key matches)
+_IndexEntry = tuple[list[_RankedSchema], list[RegisteredSchema]]
+_by_rank = itemgetter(0)
+
+
+def _ordered(ranked: list[_RankedSchema]) -> list[RegisteredSchema]:
+    """Return the schemas of ranked entries in priority order."""
+    return [schema for _, schema in sorted(ranked, key=_by_rank)]
+
 
 # =============================================================================
 # TYPE REGISTRY
@@ -206,8 +251,8 @@ class TypeRegistry:
             RequiredFieldsMatcher(frozenset({"file", "line", "message"}))
         )
 
-        # Parse output
-        for result in registry.parse_output(stdout):
+        # Parse output (iter_output streams; parse_output returns a list)
+        for result in registry.iter_output(stdout):
             if isinstance(result, ParsedRecord):
                 print(f"Parsed: {result.schema_name}")
     """
@@ -216,6 +261,11 @@ class TypeRegistry:
         """Initialize empty registry."""
         self._schemas: list[RegisteredSchema] = []
         self._by_name: dict[str, RegisteredSchema] = {}
+        # Dispatch tables: field name -> field value -> schemas keyed on that pair
+        self._index: dict[str, dict[Any, _IndexEntry]] = {}
+        # Schemas that can't be indexed and must be checked on every record
+        self._general: list[_RankedSchema] = []
+        self._general_schemas: list[RegisteredSchema] = []
 
     def register(
         self,
@@ -223,16 +273,27 @@ class TypeRegistry:
         schema: dict[str, Any],
         matcher: SchemaMatcher | None = None,
         fingerprint: str | None = None,
+        *,
+        skip_validation: bool | None = None,
     ) -> TypeRegistry:
-        """Register a schema. Returns self for chaining."""
-        if fingerprint is None:
-            fingerprint = compute_fingerprint(schema)
+        """Register a schema. Returns self for chaining.
+
+        skip_validation defaults to True for TypeTagMatcher (an explicit tag
+        is definitive) and False otherwise.
+
+        The registry keeps its own copy of schema, so later changes to the
+        caller's dict can't leave the cached canonical JSON, fingerprint and
+        validator out of step with it.
+        """
+        if skip_validation is None:
+            skip_validation = isinstance(matcher, TypeTagMatcher)
 
         registered = RegisteredSchema(
             name=name,
-            schema=schema,
-            fingerprint=fingerprint,
+            schema=copy.deepcopy(schema),
+            fingerprint=fingerprint or "",
             matcher=matcher,
+            skip_validation=skip_validation,
         )
 
         self._schemas.append(registered)
@@ -240,9 +301,56 @@ class TypeRegistry:
 
         # Keep sorted by matcher priority (highest first)
         self._schemas.sort(key=lambda s: -(s.matcher.priority() if s.matcher else 0))
+        self._rebuild_index()
 
         return self
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the dispatch tables from the priority-sorted schema list.
+
+        Type tag and discriminator matchers key off a single field value, so
+        their schemas are found with a dict lookup. Everything else stays in
+        the general list and is checked linearly. Each indexed key also
+        stores its full candidate list (its schemas merged with the general
+        ones), so a record that hits a single key needs no per-line merging.
+        """
+        ranked_index: dict[str, dict[Any, list[_RankedSchema]]] = {}
+        self._general = []
+        for rank, schema in enumerate(self._schemas):
+            key = _index_key(schema.matcher)
+            if key is None:
+                self._general.append((rank, schema))
+            else:
+                field_name, value = key
+                ranked_index.setdefault(field_name, {}).setdefault(value, []).append((rank, schema))
+
+        self._general_schemas = [schema for _, schema in self._general]
+        self._index = {
+            field_name: {value: (ranked, _ordered([*ranked, *self._general])) for value, ranked in by_value.items()}
+            for field_name, by_value in ranked_index.items()
+        }
+
+    def _candidates(self, data: dict[str, Any]) -> list[RegisteredSchema]:
+        """Return the schemas that may match data, in priority order."""
+        entries: list[_IndexEntry] = []
+        for field_name, by_value in self._index.items():
+            try:
+                entry = by_value.get(data.get(field_name))
+            except TypeError:
+                continue  # Unhashable value (list/dict) can't equal an indexed value
+            if entry is not None:
+                entries.append(entry)
+
+        if not entries:
+            return self._general_schemas
+        if len(entries) == 1:
+            return entries[0][1]
+        # Keys on several fields matched: merge their schemas with the general ones
+        ranked = list(self._general)
+        for hits, _ in entries:
+            ranked.extend(hits)
+        return _ordered(ranked)
+
     def get_schema(self, name: str) -> RegisteredSchema | None:
         """Get a schema by name."""
         return self._by_name.get(name)
@@ -252,24 +360,31 @@ class TypeRegistry:
         line = line.strip()
         if not line:
             return UnparsedLine(raw=line, reason="empty")
+        return self._parse_stripped(line)
 
+    def _parse_stripped(self, line: str) -> ParseResult:
+        """Parse a line that is already stripped and non-empty."""
         # Fast path: JSON always starts with {
         if not line.startswith("{"):
             return UnparsedLine(raw=line, reason="not JSON")
 
         try:
-            data = json.loads(line)
+            data = _json.loads(line)
         except json.JSONDecodeError as e:
             return UnparsedLine(raw=line, reason=f"JSON decode error: {e}")
 
         # Try schemas in priority order
         attempted: list[tuple[str, list[str]]] = []
 
-        for schema in self._schemas:
+        for schema in self._candidates(data):
             # If schema has a matcher, check it first
             if schema.matcher and not schema.matcher.matches(data):
                 continue
 
+            # Matcher is trusted to identify the record on its own
+            if schema.skip_validation:
+                return ParsedRecord(schema_name=schema.name, data=data, raw=line)
+
             # Validate against schema
             errors = schema.validate(data)
             if not errors:
@@ -279,9 +394,15 @@ class TypeRegistry:
 
         return ValidationFailure(data=data, raw=line, attempted=attempted)
 
+    def iter_output(self, output: str) -> Iterator[ParseResult]:
+        """Parse complete output, yielding one result per non-blank line."""
+        for line in iter_lines(output):
+            if stripped := line.strip():
+                yield self._parse_stripped(stripped)
+
     def parse_output(self, output: str) -> list[ParseResult]:
         """Parse complete output, returning all results."""
-        return [self.parse_line(line) for line in output.strip().split("\n") if line.strip()]
+        return list(self.iter_output(output))
 
     def fingerprints(self) -> dict[str, str]:
         """Get all fingerprints for drift detection."""
@@ -319,8 +440,30 @@ class TypeRegistry:
 # =============================================================================
 
 
+def _index_key(matcher: SchemaMatcher | None) -> tuple[str, Any] | None:
+    """Return the (field, value) pair a matcher can be indexed by, if any."""
+    # Exact type checks: subclasses may override matches() with other semantics
+    if type(matcher) is TypeTagMatcher:
+        key: tuple[str, Any] = (matcher.tag_field, matcher.tag_value)
+    elif type(matcher) is DiscriminatorMatcher:
+        key = (matcher.field_name, matcher.value)
+    else:
+        return None
+    # An unhashable value can't be a dict key; such matchers stay in the general list
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def compute_fingerprint(schema: dict[str, Any]) -> str:
-    """Generate fingerprint for drift detection."""
+    """Generate fingerprint for drift detection.
+
+    The format (first 16 hex chars of SHA-256 over canonical JSON) is part of
+    saved registries, so changing the hash invalidates stored fingerprints.
+    Serialization, not hashing, dominates the cost.
+    """
     content = json.dumps(schema, sort_keys=True)
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
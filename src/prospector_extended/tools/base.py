@@ -9,8 +9,13 @@ Provides common infrastructure for tool implementations:
 
 from __future__ import annotations
 
+import os
+import pickle
+import sys
 from abc import abstractmethod
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -21,6 +26,18 @@ if TYPE_CHECKING:
     from prospector.config import ProspectorConfig
     from prospector.finder import FileFinder
 
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def _usable_cpu_count() -> int:
+    """Return the number of CPUs this process may run on."""
+    if sys.version_info >= (3, 13):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
 # ToolBase is untyped in prospector, hence the type: ignore
 class ExtendedToolBase(ToolBase):  # type: ignore[misc]
@@ -30,9 +47,15 @@ class ExtendedToolBase(ToolBase):  # type: ignore[misc]
     - tool_name: class attribute with the tool's name
     - _configure_options: extract tool-specific options
     - _analyze_file: analyze a single file
+
+    Subclasses whose _analyze_file is CPU-bound and independent per file can
+    set parallel = True to fan batches of files out across a process pool.
+    The tool instance and its messages must then be picklable. Subclasses
+    that analyze many files in one call can override _analyze_files.
     """
 
     tool_name: str = ""  # Override in subclasses
+    parallel: bool = False  # Analyze files in worker processes
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the tool."""
@@ -76,8 +99,60 @@ class ExtendedToolBase(ToolBase):  # type: ignore[misc]
         Returns:
             List of prospector Message objects.
         """
+        filepaths = list(found_files.python_modules)
+        # A pool on a single usable CPU only adds startup cost
+        if self.parallel and len(filepaths) >= PARALLEL_MIN_FILES and (workers := _usable_cpu_count()) > 1 and self._is_picklable():
+            try:
+                return self._run_parallel(filepaths, workers)
+            except (OSError, BrokenProcessPool, pickle.PicklingError):
+                # No usable worker processes; fall back to in-process analysis
+                pass
+
+        return self._analyze_files(filepaths)
+
+    def _is_picklable(self) -> bool:
+        """Check whether the tool can be sent to worker processes.
+
+        Returns:
+            False if pickling fails, e.g. on a lock (TypeError) or a local object (AttributeError).
+        """
+        try:
+            pickle.dumps(self)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        return True
+
+    def _run_parallel(self, filepaths: list[Path], workers: int) -> list[Message]:
+        """Analyze batches of files in a process pool, keeping file order.
+
+        Args:
+            filepaths: Files to analyze.
+            workers: Number of worker processes.
+
+        Returns:
+            List of prospector Message objects.
+        """
+        messages: list[Message] = []
+        size = max(1, len(filepaths) // (workers * 4))
+        batches = [filepaths[i : i + size] for i in range(0, len(filepaths), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch_messages in executor.map(self._analyze_files, batches):
+                messages.extend(batch_messages)
+        return messages
+
+    def _analyze_files(self, filepaths: list[Path]) -> list[Message]:
+        """Analyze a batch of files, one at a time by default.
+
+        Tools that can analyze several files in one call override this.
+
+        Args:
+            filepaths: Files to analyze.
+
+        Returns:
+            List of messages for these files, in file order.
+        """
         messages: list[Message] = []
-        for filepath in found_files.python_modules:
+        for filepath in filepaths:
             messages.extend(self._analyze_file(filepath))
         return messages
 
@@ -123,7 +198,7 @@ class ExtendedToolBase(ToolBase):  # type: ignore[misc]
             source=self.tool_name,
             code=code,
             location=Location(
-                path=str(filepath),
+                path=filepath,
                 module=None,
                 function=function,
                 line=line,
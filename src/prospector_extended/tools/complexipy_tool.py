@@ -14,6 +14,11 @@ from prospector.message import Message
 
 from prospector_extended.tools.base import ExtendedToolBase
 
+try:
+    from complexipy import file_complexity as _file_complexity
+except ImportError:  # pragma: no cover - complexipy is a declared dependency
+    _file_complexity = None  # type: ignore[assignment,unused-ignore]
+
 # Error codes
 CODE_COMPLEXITY = "CCR001"  # Cognitive complexity too high
 CODE_PARSE_ERROR = "CCE001"  # Parse error
@@ -27,6 +32,7 @@ class ComplexipyTool(ExtendedToolBase):
     """
 
     tool_name = "complexipy"
+    parallel = True  # Per-file analysis is CPU-bound and independent
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the complexipy tool."""
@@ -39,13 +45,11 @@ class ComplexipyTool(ExtendedToolBase):
 
     def _analyze_file(self, filepath: Path) -> list[Message]:
         """Analyze a single file for complexity issues."""
-        try:
-            from complexipy import file_complexity
-        except ImportError:
+        if _file_complexity is None:
             return []
 
         try:
-            file_result = file_complexity(str(filepath.absolute()))
+            file_result = _file_complexity(str(filepath.absolute()))
             return [msg for func in file_result.functions if (msg := self._check_function(filepath, func)) is not None]
         except SyntaxError as e:
             msg = self._syntax_error_message(filepath, e)
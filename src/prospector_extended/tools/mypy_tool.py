@@ -9,9 +9,13 @@ This tool provides robust mypy integration with:
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from mypy import api as mypy_api
 from prospector.message import Location, Message
 from prospector.tools.base import ToolBase
 
@@ -122,6 +126,39 @@ DEFAULT_OPTIONS: list[str] = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
+def _error_path(file: str, cwd: str) -> Path:
+    """Resolve a reported file against the working directory.
+
+    Errors cluster in a few files, and Location absolutizes an absolute
+    Path far more cheaply than a str, so resolved paths are cached.
+    """
+    return Path(cwd, file)
+
+
+def _error_to_message(error: MypyJsonOutput) -> Message | None:
+    """Convert a single error to a message, dropping notes."""
+    if error.severity == "note":
+        return None
+
+    message_text = error.message
+    if error.hint:
+        message_text = f"{message_text} ({error.hint})"
+
+    return Message(
+        source="mypy",
+        code=error.code or "error",
+        location=Location(
+            path=_error_path(error.file, os.getcwd()),  # noqa: PTH109 - Path.cwd() costs 10x more per error
+            module=None,
+            function=None,
+            line=error.line,
+            character=error.column,
+        ),
+        message=message_text,
+    )
+
+
 # ToolBase is untyped in prospector, hence the type: ignore
 # Note: MypyTool doesn't use ExtendedToolBase because mypy runs once on all files,
 # not file-by-file like complexipy and interrogate.
@@ -136,6 +173,7 @@ class MypyTool(ToolBase):  # type: ignore[misc]
         """Initialize the mypy tool."""
         super().__init__(*args, **kwargs)
         self.options: list[str] = []
+        self._arg_prefix: tuple[str, ...] = ()
         self._configured = False
 
     def configure(
@@ -145,14 +183,24 @@ class MypyTool(ToolBase):  # type: ignore[misc]
     ) -> tuple[str, Iterable[Message]] | None:
         """Configure mypy options from prospector config."""
         options = prospector_config.tool_options("mypy")
-        self.options = self._build_base_options(options)
-        self.options.extend(self._build_user_options(options))
-        self.options.extend(self._build_message_options(prospector_config))
+        self.options = list(self._iter_all_options(options, prospector_config))
+        self._arg_prefix = ("--output=json", *self.options)
         self._configured = True
         return None
 
+    def _iter_all_options(self, options: dict[str, Any], prospector_config: ProspectorConfig) -> Iterator[str]:
+        """Yield base, user and message options in command-line order."""
+        yield from self._build_base_options(options)
+        yield from self._iter_user_options(options)
+        yield from self._iter_message_options(prospector_config)
+
     def _build_base_options(self, options: dict[str, Any]) -> list[str]:
-        """Build base options for reliable parsing."""
+        """Build base options for reliable parsing.
+
+        mypy runs incrementally by default, reusing its cache (``.mypy_cache``
+        or the configured cache_dir) across runs; the ``no-incremental``
+        option disables that.
+        """
         base = [
             "--show-column-numbers",
             "--no-error-summary",
@@ -163,14 +211,16 @@ class MypyTool(ToolBase):  # type: ignore[misc]
             base.append("--follow-imports=normal")
         return base
 
-    def _build_user_options(self, options: dict[str, Any]) -> list[str]:
-        """Build user-specified options."""
-        result: list[str] = []
+    def _iter_user_options(self, options: dict[str, Any]) -> Iterator[str]:
+        """Yield user-specified options in the order they were configured."""
+        # One intersection finds the mypy flags among the configured keys;
+        # the common no-flags case skips the loop
+        valid = options.keys() & VALID_OPTIONS
+        if not valid:
+            return
         for name, value in options.items():
-            if name not in VALID_OPTIONS:
-                continue
-            result.extend(self._format_option(name, value))
-        return result
+            if name in valid:
+                yield from self._format_option(name, value)
 
     @staticmethod
     def _format_option(name: str, value: Any) -> list[str]:
@@ -184,68 +234,40 @@ class MypyTool(ToolBase):  # type: ignore[misc]
         return [f"--{name}={value}"]
 
     @staticmethod
-    def _build_message_options(prospector_config: ProspectorConfig) -> list[str]:
-        """Build options for disabled/enabled messages."""
-        result: list[str] = []
+    def _iter_message_options(prospector_config: ProspectorConfig) -> Iterator[str]:
+        """Yield options for disabled/enabled messages."""
         for code in prospector_config.get_disabled_messages("mypy"):
-            result.append(f"--disable-error-code={code}")
+            yield f"--disable-error-code={code}"
         for code in prospector_config.get_enabled_messages("mypy"):
-            result.append(f"--enable-error-code={code}")
-        return result
+            yield f"--enable-error-code={code}"
 
     def run(self, found_files: FileFinder) -> list[Message]:
         """Run mypy on the found files."""
         if not self._configured:
             self.options = list(DEFAULT_OPTIONS)
+            self._arg_prefix = ("--output=json", *self.options)
 
-        paths = [str(path) for path in found_files.python_modules]
-        if not paths:
+        # Paths go straight onto the argument list; no files means no extra args
+        args = [*self._arg_prefix, *map(str, found_files.python_modules)]
+        if len(args) == len(self._arg_prefix):
             return []
 
-        stdout, stderr = self._run_mypy(paths)
+        stdout, stderr = self._run_mypy(args)
         parsed = parse_mypy_output(stdout, stderr)
-        return [msg for error in parsed if (msg := self._error_to_message(error)) is not None]
-
-    def _run_mypy(self, paths: list[str]) -> tuple[str, str]:
-        """Run mypy using the Python API."""
-        import os
-
-        import mypy.api
+        return [msg for error in parsed if (msg := _error_to_message(error)) is not None]
 
+    def _run_mypy(self, args: list[str]) -> tuple[str, str]:
+        """Run mypy using the Python API with the full argument list."""
         # Python 3.14+ argparse checks TTY for color support during init,
         # which fails when stdout/stderr are captured. Set NO_COLOR to
         # prevent this before mypy parses arguments.
         old_no_color = os.environ.get("NO_COLOR")
         os.environ["NO_COLOR"] = "1"
         try:
-            args = ["--output=json", *self.options, *paths]
-            stdout, stderr, _ = mypy.api.run(args)
+            stdout, stderr, _ = mypy_api.run(args)
             return stdout, stderr
         finally:
             if old_no_color is None:
                 os.environ.pop("NO_COLOR", None)
             else:
                 os.environ["NO_COLOR"] = old_no_color
-
-    @staticmethod
-    def _error_to_message(error: MypyJsonOutput) -> Message | None:
-        """Convert a single error to a message."""
-        if error.severity == "note":
-            return None
-
-        message_text = error.message
-        if error.hint:
-            message_text = f"{message_text} ({error.hint})"
-
-        return Message(
-            source="mypy",
-            code=error.code or "error",
-            location=Location(
-                path=error.file,
-                module=None,
-                function=None,
-                line=error.line,
-                character=error.column,
-            ),
-            message=message_text,
-        )
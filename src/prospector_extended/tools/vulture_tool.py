@@ -18,6 +18,7 @@ those items as "used" and won't report them as dead code.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -30,6 +31,79 @@ if TYPE_CHECKING:
     from prospector.config import ProspectorConfig
     from prospector.finder import FileFinder
 
+# Map vulture item types to error codes
+_TYPE_TO_CODE: dict[str, str] = {
+    "function": "unused-function",
+    "property": "unused-property",
+    "variable": "unused-variable",
+    "attribute": "unused-attribute",
+    "class": "unused-class",
+    "import": "unused-import",
+    "method": "unused-method",
+}
+
+# Vulture attributes that accumulate definitions and uses while scanning.
+# Restored in place: vulture's reachability checker holds a reference to
+# unreachable_code.
+_SCAN_STATE_ATTRS = (
+    "defined_attrs",
+    "defined_classes",
+    "defined_funcs",
+    "defined_imports",
+    "defined_methods",
+    "defined_props",
+    "defined_vars",
+    "unreachable_code",
+    "used_names",
+    "_internal_messages",
+)
+
+# Snapshot of _SCAN_STATE_ATTRS contents, by attribute name
+ScanState = dict[str, tuple[Any, ...]]
+
+
+def _item_accessors(item: Any) -> tuple[attrgetter[Any], attrgetter[Any]]:
+    """Pick the file and line accessors for this vulture version's items.
+
+    Older vulture items carry file/lineno, newer ones filename/first_lineno.
+    Probing one item lets the rest be read without per-item fallbacks.
+
+    Args:
+        item: Any item returned by get_unused_code().
+
+    Returns:
+        Getters for the item's file and line number.
+    """
+    return (
+        attrgetter("file" if hasattr(item, "file") else "filename"),
+        attrgetter("lineno" if hasattr(item, "lineno") else "first_lineno"),
+    )
+
+
+# Decoded whitelist sources by resolved path, with the mtime they were read at.
+# Whitelists rarely change, so repeated runs in one process reuse the text.
+_WHITELIST_CACHE: dict[str, tuple[int, str]] = {}
+
+
+def _read_whitelist(filepath: Path) -> str:
+    """Read a whitelist file, reusing the cached text while its mtime is unchanged.
+
+    Args:
+        filepath: Path to the whitelist file.
+
+    Returns:
+        The decoded file contents.
+    """
+    key = str(filepath.resolve())
+    mtime = filepath.stat().st_mtime_ns
+    cached = _WHITELIST_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    module_string: str = read_py_file(filepath)
+    _WHITELIST_CACHE[key] = (mtime, module_string)
+    return module_string
+
 
 class ProspectorVultureExtended(Vulture):  # type: ignore[misc]  # Vulture has no type stubs
     """Extended Vulture with whitelist support.
@@ -66,14 +140,49 @@ class ProspectorVultureExtended(Vulture):  # type: ignore[misc]  # Vulture has n
         The arguments are ignored - we use the found_files from __init__.
         They're here to match the Vulture.scavenge signature.
         """
-        # First, scan whitelist files to mark items as "used"
+        self.scan_whitelists()
+        self.scan_sources()
+
+    def scan_whitelists(self) -> None:
+        """Scan whitelist files to mark the items they reference as "used"."""
         for whitelist_path in self._whitelist_paths:
             self._scan_file(whitelist_path, is_whitelist=True)
 
-        # Then scan source files
+    def scan_sources(self) -> None:
+        """Scan the source files from found_files."""
         for module in self._files.python_modules:
             self._scan_file(module, is_whitelist=False)
 
+    def snapshot(self) -> ScanState | None:
+        """Capture the accumulated scan state, e.g. right after scan_whitelists.
+
+        Returns:
+            An immutable copy of the definitions, uses and messages so far, or
+            None if this vulture version doesn't keep them in the expected
+            attributes (callers then rescan instead).
+        """
+        state: ScanState = {}
+        for name in _SCAN_STATE_ATTRS:
+            target = getattr(self, name, None)
+            if not isinstance(target, (list, set)):
+                return None
+            state[name] = tuple(target)
+        return state
+
+    def restore(self, state: ScanState) -> None:
+        """Replace the accumulated scan state with a snapshot.
+
+        Args:
+            state: A snapshot taken with snapshot().
+        """
+        for name, items in state.items():
+            target = getattr(self, name)
+            target.clear()
+            if isinstance(target, set):
+                target.update(items)
+            else:
+                target.extend(items)
+
     def _scan_file(self, filepath: Path, *, is_whitelist: bool) -> None:
         """Scan a single file.
 
@@ -81,8 +190,13 @@ class ProspectorVultureExtended(Vulture):  # type: ignore[misc]  # Vulture has n
             filepath: Path to the file.
             is_whitelist: True if this is a whitelist file (errors are warnings).
         """
+        # One stat settles missing (or non-file) whitelists before any read
+        if is_whitelist and not filepath.is_file():
+            self._whitelist_not_found(filepath)
+            return
+
         try:
-            module_string = read_py_file(filepath)
+            module_string = _read_whitelist(filepath) if is_whitelist else read_py_file(filepath)
         except CouldNotHandleEncoding as err:
             # Only report encoding errors for source files, not whitelists
             if not is_whitelist:
@@ -96,16 +210,9 @@ class ProspectorVultureExtended(Vulture):  # type: ignore[misc]  # Vulture has n
                 )
             return
         except FileNotFoundError:
-            # Whitelist file not found - report as warning
+            # Removed since the check above - report as warning
             if is_whitelist:
-                self._internal_messages.append(
-                    make_tool_error_message(
-                        filepath,
-                        "vulture",
-                        "V001",
-                        message=f"Whitelist file not found: {filepath}",
-                    )
-                )
+                self._whitelist_not_found(filepath)
             return
 
         self.file = filepath
@@ -116,40 +223,38 @@ class ProspectorVultureExtended(Vulture):  # type: ignore[misc]  # Vulture has n
             # Older vulture versions don't accept filename
             self.scan(module_string)
 
+    def _whitelist_not_found(self, filepath: Path) -> None:
+        """Record a V001 warning for a missing whitelist file."""
+        self._internal_messages.append(
+            make_tool_error_message(
+                filepath,
+                "vulture",
+                "V001",
+                message=f"Whitelist file not found: {filepath}",
+            )
+        )
+
     def get_messages(self) -> list[Message]:
         """Get all vulture messages filtered by min_confidence.
 
         Returns:
             List of prospector Message objects for unused code.
         """
-        # Map vulture item types to error codes
-        type_to_code = {
-            "function": "unused-function",
-            "property": "unused-property",
-            "variable": "unused-variable",
-            "attribute": "unused-attribute",
-            "class": "unused-class",
-            "import": "unused-import",
-            "method": "unused-method",
-        }
-
-        vulture_messages = []
         # get_unused_code() returns all items filtered by min_confidence
-        for item in self.get_unused_code(min_confidence=self._min_confidence):
-            try:
-                filename = item.file
-            except AttributeError:
-                filename = item.filename
-            lineno = item.lineno if hasattr(item, "lineno") else item.first_lineno
-
-            # Get the error code based on item type
-            code = type_to_code.get(item.typ, f"unused-{item.typ}")
-
-            loc = Location(filename, None, None, lineno, -1)
-            message_text = f"Unused {item.typ} '{item.name}' ({item.confidence}% confidence)"
-            message = Message("vulture", code, loc, message_text)
-            vulture_messages.append(message)
-
+        unused = self.get_unused_code(min_confidence=self._min_confidence)
+        if not unused:
+            return list(self._internal_messages)
+
+        get_file, get_lineno = _item_accessors(unused[0])
+        vulture_messages = [
+            Message(
+                "vulture",
+                _TYPE_TO_CODE.get(item.typ) or f"unused-{item.typ}",
+                Location(get_file(item), None, None, get_lineno(item), -1),
+                f"Unused {item.typ} '{item.name}' ({item.confidence}% confidence)",
+            )
+            for item in unused
+        ]
         return self._internal_messages + vulture_messages
 
 
@@ -177,6 +282,8 @@ class VultureTool(ToolBase):  # type: ignore[misc]
         self._whitelist_paths: list[Path] = []
         self._min_confidence: int = 60
         self.ignore_codes: list[str] = []
+        self._primed_key: tuple[tuple[str, int | None], ...] | None = None
+        self._primed_state: ScanState | None = None
 
     def configure(self, prospector_config: ProspectorConfig, _found_files: FileFinder) -> tuple[str, Iterable[Message]] | None:
         """Configure vulture options from prospector config.
@@ -218,5 +325,27 @@ class VultureTool(ToolBase):  # type: ignore[misc]
             whitelist_paths=self._whitelist_paths,
             min_confidence=self._min_confidence,
         )
-        vulture.scavenge()
+        # Whitelists don't change between runs, so their scan state is kept
+        # and restored until the configured paths or their mtimes change; if
+        # the state can't be captured, every run scans the whitelists afresh
+        key = self._whitelist_key()
+        if self._primed_state is None or key != self._primed_key:
+            vulture.scan_whitelists()
+            self._primed_state = vulture.snapshot()
+            self._primed_key = key
+        else:
+            vulture.restore(self._primed_state)
+        vulture.scan_sources()
         return [message for message in vulture.get_messages() if message.code not in self.ignore_codes]
+
+    def _whitelist_key(self) -> tuple[tuple[str, int | None], ...]:
+        """Identify the current whitelist contents by path and mtime."""
+        key = []
+        for path in self._whitelist_paths:
+            try:
+                mtime: int | None = path.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            # Resolved like _read_whitelist's cache key, so any spelling of a path matches
+            key.append((str(path.resolve()), mtime))
+        return tuple(key)
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def mypy_cache_dir(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Share one mypy cache across every mypy run in the session.
+
+    Exported as MYPY_CACHE_DIR, which mypy prefers over its configured
+    cache_dir. Lives under pytest's cache so it stays warm between sessions
+    without writing .mypy_cache into the working tree; falls back to a
+    session temp dir when the cache provider is disabled. Under pytest-xdist
+    each worker gets its own directory.
+    """
+    # mypy's cache isn't safe for concurrent writers: one per xdist worker
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    name = f"mypy-{worker}" if worker else "mypy"
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir(name) if cache is not None else tmp_path_factory.mktemp(name)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MYPY_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Return the path to the fixtures directory."""
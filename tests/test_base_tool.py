@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from prospector.message import Message
 
-from prospector_extended.tools.base import ExtendedToolBase
+from prospector_extended.tools.base import PARALLEL_MIN_FILES, ExtendedToolBase
 
 
 class ConcreteTestTool(ExtendedToolBase):
@@ -24,6 +26,13 @@ class ConcreteTestTool(ExtendedToolBase):
         return [msg] if msg else []
 
 
+class FailingTestTool(ConcreteTestTool):
+    """Tool whose analysis fails with a bug in the tool itself."""
+
+    def _analyze_file(self, filepath: Path) -> list[Message]:
+        raise TypeError(f"bug while analyzing {filepath.name}")
+
+
 class TestCreateMessage:
     """Tests for _create_message()."""
 
@@ -63,6 +72,12 @@ class TestCreateMessage:
         assert msg is not None
         assert msg.location.function is None
 
+    def test_location_path_is_absolute(self):
+        tool = ConcreteTestTool()
+        msg = tool._create_message("E001", Path("pkg/test.py"), 1, "Test")
+        assert msg is not None
+        assert msg.location.path == Path("pkg/test.py").absolute()
+
 
 class TestRun:
     """Tests for run()."""
@@ -99,6 +114,64 @@ class TestRun:
         messages = tool.run(finder)
         assert messages == []
 
+    def test_parallel_run_preserves_file_order(self, monkeypatch):
+        monkeypatch.setattr("prospector_extended.tools.base._usable_cpu_count", lambda: 2)
+        tool = ConcreteTestTool()
+        tool.parallel = True
+        finder = MagicMock()
+        finder.python_modules = [Path(f"file{i}.py") for i in range(PARALLEL_MIN_FILES)]
+        messages = tool.run(finder)
+        assert [Path(m.location.path).name for m in messages] == [p.name for p in finder.python_modules]
+
+    def test_parallel_falls_back_when_pool_unavailable(self, monkeypatch):
+        def broken_pool(*args, **kwargs):
+            raise OSError("no worker processes")
+
+        monkeypatch.setattr("prospector_extended.tools.base._usable_cpu_count", lambda: 2)
+        monkeypatch.setattr("prospector_extended.tools.base.ProcessPoolExecutor", broken_pool)
+        tool = ConcreteTestTool()
+        tool.parallel = True
+        finder = MagicMock()
+        finder.python_modules = [Path(f"file{i}.py") for i in range(PARALLEL_MIN_FILES)]
+        messages = tool.run(finder)
+        assert len(messages) == PARALLEL_MIN_FILES
+
+    def test_parallel_falls_back_when_tool_unpicklable(self, monkeypatch):
+        def unexpected_pool(*args, **kwargs):
+            raise AssertionError("pool started for an unpicklable tool")
+
+        monkeypatch.setattr("prospector_extended.tools.base._usable_cpu_count", lambda: 2)
+        monkeypatch.setattr("prospector_extended.tools.base.ProcessPoolExecutor", unexpected_pool)
+        tool = ConcreteTestTool()
+        tool.parallel = True
+        tool.lock = threading.Lock()
+        finder = MagicMock()
+        finder.python_modules = [Path(f"file{i}.py") for i in range(PARALLEL_MIN_FILES)]
+        messages = tool.run(finder)
+        assert len(messages) == PARALLEL_MIN_FILES
+
+    def test_parallel_worker_errors_propagate(self, monkeypatch):
+        monkeypatch.setattr("prospector_extended.tools.base._usable_cpu_count", lambda: 2)
+        tool = FailingTestTool()
+        tool.parallel = True
+        finder = MagicMock()
+        finder.python_modules = [Path(f"file{i}.py") for i in range(PARALLEL_MIN_FILES)]
+        with pytest.raises(TypeError, match="bug while analyzing"):
+            tool.run(finder)
+
+    def test_single_cpu_runs_in_process(self, monkeypatch):
+        def unexpected_pool(*args, **kwargs):
+            raise AssertionError("pool started on a single CPU")
+
+        monkeypatch.setattr("prospector_extended.tools.base._usable_cpu_count", lambda: 1)
+        monkeypatch.setattr("prospector_extended.tools.base.ProcessPoolExecutor", unexpected_pool)
+        tool = ConcreteTestTool()
+        tool.parallel = True
+        finder = MagicMock()
+        finder.python_modules = [Path(f"file{i}.py") for i in range(PARALLEL_MIN_FILES)]
+        messages = tool.run(finder)
+        assert len(messages) == PARALLEL_MIN_FILES
+
 
 class TestConfigure:
     """Tests for configure()."""
@@ -13,6 +13,8 @@ from prospector_extended.tools.complexipy_tool import CODE_COMPLEXITY, Complexip
 class MockProspectorConfig:
     """Mock prospector config for testing."""
 
+    __slots__ = ("_disabled", "_options")
+
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         """Initialize with optional tool options."""
         self._options = options or {}
@@ -30,6 +32,8 @@ class MockProspectorConfig:
 class MockFileFinder:
     """Mock file finder for testing."""
 
+    __slots__ = ("python_modules",)
+
     def __init__(self, files: list[Path]) -> None:
         """Initialize with list of files."""
         self.python_modules = files
@@ -70,28 +74,26 @@ class TestComplexipyToolConfiguration:
 class TestComplexipyToolRun:
     """Tests for complexipy tool execution."""
 
-    def test_run_on_simple_file(self) -> None:
+    def test_run_on_simple_file(self, clean_file: Path) -> None:
         """Test running complexipy on a simple file."""
         tool = ComplexipyTool()
         config = MockProspectorConfig()
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "clean.py"])
+        finder = MockFileFinder([clean_file])
 
         messages = tool.run(finder)
 
         # Clean file should have low complexity
         assert all(m.code != CODE_COMPLEXITY for m in messages)
 
-    def test_run_on_complex_file(self) -> None:
+    def test_run_on_complex_file(self, high_complexity_file: Path) -> None:
         """Test running complexipy on a complex file."""
         tool = ComplexipyTool()
         config = MockProspectorConfig({"max-complexity": 5})  # Low threshold
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "high_complexity.py"])
+        finder = MockFileFinder([high_complexity_file])
 
         messages = tool.run(finder)
 
@@ -114,33 +116,29 @@ class TestComplexipyToolRun:
 
         assert messages == []
 
-    def test_threshold_respected(self) -> None:
+    def test_threshold_respected(self, high_complexity_file: Path) -> None:
         """Test that threshold is respected."""
         # High threshold - should find nothing
         tool = ComplexipyTool()
         config = MockProspectorConfig({"max-complexity": 100})
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "high_complexity.py"])
+        finder = MockFileFinder([high_complexity_file])
 
         messages = tool.run(finder)
 
-        complexity_messages = [m for m in messages if m.code == CODE_COMPLEXITY]
-        assert len(complexity_messages) == 0
+        assert not any(m.code == CODE_COMPLEXITY for m in messages)
 
-    def test_disabled_code_skipped(self) -> None:
+    def test_disabled_code_skipped(self, high_complexity_file: Path) -> None:
         """Test that disabled codes are skipped."""
         tool = ComplexipyTool()
         config = MockProspectorConfig({"max-complexity": 1})  # Very low threshold
         config._disabled = [CODE_COMPLEXITY]
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "high_complexity.py"])
+        finder = MockFileFinder([high_complexity_file])
 
         messages = tool.run(finder)
 
         # Should find nothing since code is disabled
-        complexity_messages = [m for m in messages if m.code == CODE_COMPLEXITY]
-        assert len(complexity_messages) == 0
+        assert not any(m.code == CODE_COMPLEXITY for m in messages)
@@ -7,12 +7,15 @@ from typing import Any
 
 import pytest
 
-from prospector_extended.tools.interrogate_tool import InterrogateTool
+from prospector_extended.tools.base import PARALLEL_MIN_FILES
+from prospector_extended.tools.interrogate_tool import NODE_INFO, InterrogateTool, _absolute_names
 
 
 class MockProspectorConfig:
     """Mock prospector config for testing."""
 
+    __slots__ = ("_disabled", "_options")
+
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         """Initialize with optional tool options."""
         self._options = options or {}
@@ -30,6 +33,8 @@ class MockProspectorConfig:
 class MockFileFinder:
     """Mock file finder for testing."""
 
+    __slots__ = ("python_modules",)
+
     def __init__(self, files: list[Path]) -> None:
         """Initialize with list of files."""
         self.python_modules = files
@@ -47,69 +52,77 @@ class TestInterrogateToolConfiguration:
 
         assert tool._config_options == {}
 
-    def test_ignore_init_method(self) -> None:
-        """Test ignore-init-method option."""
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            ({"ignore-init-method": True}, {"ignore_init_method": True}),
+            ({"ignore-magic": True}, {"ignore_magic": True}),
+            (
+                {"ignore-init-method": True, "ignore-magic": True, "ignore-module": True},
+                {"ignore_init_method": True, "ignore_magic": True, "ignore_module": True},
+            ),
+        ],
+        ids=["init-method", "magic", "multiple"],
+    )
+    def test_ignore_options(self, options: dict[str, Any], expected: dict[str, bool]) -> None:
+        """Test that ignore options are mapped to interrogate config names."""
         tool = InterrogateTool()
-        config = MockProspectorConfig({"ignore-init-method": True})
 
-        tool.configure(config, None)
+        tool.configure(MockProspectorConfig(options), None)
 
-        assert tool._config_options.get("ignore_init_method") is True
+        for name, value in expected.items():
+            assert tool._config_options.get(name) is value
 
-    def test_ignore_magic(self) -> None:
-        """Test ignore-magic option."""
+    def test_config_built_once_on_configure(self) -> None:
+        """Test that the interrogate config is built at configure time."""
         tool = InterrogateTool()
         config = MockProspectorConfig({"ignore-magic": True})
-
         tool.configure(config, None)
 
-        assert tool._config_options.get("ignore_magic") is True
+        assert tool._conf.ignore_magic is True
 
-    def test_multiple_options(self) -> None:
-        """Test multiple options."""
+    def test_ignore_module_flag(self) -> None:
+        """Test that ignore-module is resolved to a flag at configure time."""
         tool = InterrogateTool()
-        config = MockProspectorConfig(
-            {
-                "ignore-init-method": True,
-                "ignore-magic": True,
-                "ignore-module": True,
-            }
-        )
+        assert tool._ignore_module is False
 
-        tool.configure(config, None)
+        tool.configure(MockProspectorConfig({"ignore-module": True}), None)
+        assert tool._ignore_module is True
 
-        assert tool._config_options.get("ignore_init_method") is True
-        assert tool._config_options.get("ignore_magic") is True
-        assert tool._config_options.get("ignore_module") is True
+    def test_parallel_option(self) -> None:
+        """Test that parallel analysis is on by default and can be disabled."""
+        tool = InterrogateTool()
+        tool.configure(MockProspectorConfig(), None)
+        assert tool.parallel is True
+
+        tool.configure(MockProspectorConfig({"parallel": False}), None)
+        assert tool.parallel is False
 
 
 class TestInterrogateToolRun:
     """Tests for interrogate tool execution."""
 
-    def test_run_on_documented_file(self) -> None:
+    def test_run_on_documented_file(self, clean_file: Path) -> None:
         """Test running interrogate on a well-documented file."""
         tool = InterrogateTool()
         config = MockProspectorConfig()
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "clean.py"])
+        finder = MockFileFinder([clean_file])
 
         messages = tool.run(finder)
 
         # Clean file is well-documented
         # May still have module-level docstring missing
-        function_messages = [m for m in messages if "function" in m.message.lower()]
-        assert len(function_messages) == 0
+        assert not any("function" in m.message.lower() for m in messages)
 
-    def test_run_on_undocumented_file(self) -> None:
+    def test_run_on_undocumented_file(self, missing_docstrings_file: Path) -> None:
         """Test running interrogate on an undocumented file."""
         tool = InterrogateTool()
         config = MockProspectorConfig()
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "missing_docstrings.py"])
+        finder = MockFileFinder([missing_docstrings_file])
 
         messages = tool.run(finder)
 
@@ -117,8 +130,16 @@ class TestInterrogateToolRun:
         assert len(messages) > 0
 
         # Should include function and class mentions
-        codes = [m.code for m in messages]
-        assert any(code.startswith("INT") for code in codes)
+        assert any(m.code.startswith("INT") for m in messages)
+
+    def test_undocumented_class_code(self, missing_docstrings_file: Path) -> None:
+        """Test that a class missing its docstring is reported as INT101."""
+        tool = InterrogateTool()
+        tool.configure(MockProspectorConfig(), None)
+
+        messages = tool.run(MockFileFinder([missing_docstrings_file]))
+
+        assert [m.code for m in messages if m.location.function == "UndocumentedClass"] == ["INT101"]
 
     def test_run_with_empty_files(self) -> None:
         """Test running interrogate with no files."""
@@ -132,29 +153,26 @@ class TestInterrogateToolRun:
 
         assert messages == []
 
-    def test_ignore_module_docstring(self) -> None:
+    def test_ignore_module_docstring(self, missing_docstrings_file: Path) -> None:
         """Test ignoring module docstrings."""
         tool = InterrogateTool()
         config = MockProspectorConfig({"ignore-module": True})
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "missing_docstrings.py"])
+        finder = MockFileFinder([missing_docstrings_file])
 
         messages = tool.run(finder)
 
         # Should not report missing module docstring
-        module_messages = [m for m in messages if m.code == "INT100"]
-        assert len(module_messages) == 0
+        assert not any(m.code == "INT100" for m in messages)
 
-    def test_message_format(self) -> None:
+    def test_message_format(self, missing_docstrings_file: Path) -> None:
         """Test message format."""
         tool = InterrogateTool()
         config = MockProspectorConfig()
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "missing_docstrings.py"])
+        finder = MockFileFinder([missing_docstrings_file])
 
         messages = tool.run(finder)
 
@@ -164,3 +182,62 @@ class TestInterrogateToolRun:
             assert msg.code.startswith("INT")
             assert "Missing docstring" in msg.message
             assert str(msg.location.path).endswith("missing_docstrings.py")
+
+    def test_batched_run_keeps_file_order(self, missing_docstrings_file: Path, fixtures_dir: Path) -> None:
+        """Test that one batched run reports files in the given order."""
+        tool = InterrogateTool()
+        config = MockProspectorConfig()
+        tool.configure(config, None)
+
+        files = [missing_docstrings_file, fixtures_dir / "dead_code.py"]
+
+        batched = tool.run(MockFileFinder(files))
+        per_file = [msg for path in files for msg in tool._analyze_file(path)]
+
+        assert [(m.location.path, m.location.line, m.code) for m in batched] == [(m.location.path, m.location.line, m.code) for m in per_file]
+
+    def test_batched_run_isolates_unparseable_file(self, missing_docstrings_file: Path, tmp_path: Path) -> None:
+        """Test that a syntax error in one file doesn't drop the others."""
+        tool = InterrogateTool()
+        config = MockProspectorConfig()
+        tool.configure(config, None)
+
+        broken = tmp_path / "broken.py"
+        broken.write_text("def broken(:\n")
+
+        messages = tool.run(MockFileFinder([broken, missing_docstrings_file]))
+
+        assert messages
+        assert all(str(m.location.path).endswith("missing_docstrings.py") for m in messages)
+
+    def test_parallel_run_matches_serial(self, missing_docstrings_file: Path, clean_file: Path) -> None:
+        """Test that batched worker runs report the same messages in order."""
+        files = [missing_docstrings_file, clean_file] * (PARALLEL_MIN_FILES // 2)
+
+        serial = InterrogateTool()
+        serial.configure(MockProspectorConfig({"parallel": False}), None)
+        parallel = InterrogateTool()
+        parallel.configure(MockProspectorConfig(), None)
+
+        expected = [(m.location.path, m.location.line, m.code) for m in serial.run(MockFileFinder(files))]
+        assert [(m.location.path, m.location.line, m.code) for m in parallel.run(MockFileFinder(files))] == expected
+
+
+class TestNodeInfo:
+    """Tests for the node type lookup table."""
+
+    def test_codes_and_display_names(self) -> None:
+        """Test precomputed codes and message prefixes for interrogate node types."""
+        assert NODE_INFO["Module"] == ("INT100", "Missing docstring for module: ")
+        assert NODE_INFO["ClassDef"] == ("INT101", "Missing docstring for class: ")
+        assert NODE_INFO["FunctionDef"] == ("INT102", "Missing docstring for function: ")
+        assert NODE_INFO["AsyncFunctionDef"] == ("INT103", "Missing docstring for async function: ")
+
+
+class TestAbsoluteNames:
+    """Tests for absolute path string conversion."""
+
+    def test_matches_path_absolute(self) -> None:
+        """Test that names match Path.absolute() for relative and absolute paths."""
+        paths = [Path("pkg/mod.py"), Path("top.py"), Path(__file__)]
+        assert _absolute_names(paths) == [str(p.absolute()) for p in paths]
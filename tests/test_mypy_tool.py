@@ -8,12 +8,14 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from prospector_extended.tools.mypy_tool import MypyTool
+from prospector_extended.tools.mypy_tool import MypyTool, _error_to_message
 
 
 class MockProspectorConfig:
     """Mock prospector config for testing."""
 
+    __slots__ = ("_disabled", "_enabled", "_options")
+
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         """Initialize with optional tool options."""
         self._options = options or {}
@@ -36,6 +38,8 @@ class MockProspectorConfig:
 class MockFileFinder:
     """Mock file finder for testing."""
 
+    __slots__ = ("python_modules",)
+
     def __init__(self, files: list[Path]) -> None:
         """Initialize with list of files."""
         self.python_modules = files
@@ -73,6 +77,28 @@ class TestMypyToolConfiguration:
 
         assert "--python-version=3.12" in tool.options
 
+    def test_incremental_by_default(self) -> None:
+        """Test that incremental mode is left on and the cache dir isn't overridden."""
+        tool = MypyTool()
+        tool.configure(MockProspectorConfig(), None)
+
+        assert "--no-incremental" not in tool.options
+        assert not any(opt.startswith("--cache-dir") for opt in tool.options)
+
+    def test_fixed_format_cache_not_requested(self) -> None:
+        """Test that the experimental fixed-format cache flag is never passed."""
+        tool = MypyTool()
+        tool.configure(MockProspectorConfig(), None)
+
+        assert "--fixed-format-cache" not in tool.options
+
+    def test_no_incremental_option(self) -> None:
+        """Test that no-incremental disables the cache."""
+        tool = MypyTool()
+        tool.configure(MockProspectorConfig({"no-incremental": True}), None)
+
+        assert tool.options.count("--no-incremental") == 1
+
     def test_disabled_error_codes(self) -> None:
         """Test disabled error codes."""
         tool = MypyTool()
@@ -84,18 +110,38 @@ class TestMypyToolConfiguration:
         assert "--disable-error-code=arg-type" in tool.options
         assert "--disable-error-code=return-value" in tool.options
 
+    def test_user_options_keep_config_order(self) -> None:
+        """Test that user options follow the configured order, not set order."""
+        tool = MypyTool()
+        config = MockProspectorConfig({"warn-unreachable": True, "python-version": "3.12", "strict": True})
+        tool.configure(config, None)
+
+        user = [o for o in tool.options if o in ("--warn-unreachable", "--python-version=3.12", "--strict")]
+        assert user == ["--warn-unreachable", "--python-version=3.12", "--strict"]
+
+    def test_option_order(self) -> None:
+        """Test that base, user and message options keep their command-line order."""
+        tool = MypyTool()
+        config = MockProspectorConfig({"strict": True, "not-a-mypy-option": True})
+        config._enabled = ["redundant-expr"]
+
+        tool.configure(config, None)
+
+        assert tool.options[0] == "--show-column-numbers"
+        assert tool.options[-2:] == ["--strict", "--enable-error-code=redundant-expr"]
+        assert "--not-a-mypy-option" not in tool.options
+
 
 class TestMypyToolRun:
     """Tests for mypy tool execution."""
 
-    def test_run_on_clean_file(self) -> None:
+    def test_run_on_clean_file(self, clean_file: Path) -> None:
         """Test running mypy on a clean file."""
         tool = MypyTool()
         config = MockProspectorConfig()
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "clean.py"])
+        finder = MockFileFinder([clean_file])
 
         messages = tool.run(finder)
 
@@ -104,14 +150,13 @@ class TestMypyToolRun:
         # Note: This may still have errors depending on mypy strictness
         # The important thing is that it runs without crashing
 
-    def test_run_on_type_errors(self) -> None:
+    def test_run_on_type_errors(self, type_errors_file: Path) -> None:
         """Test running mypy on file with type errors."""
         tool = MypyTool()
         config = MockProspectorConfig({"strict": True})
         tool.configure(config, None)
 
-        fixtures_dir = Path(__file__).parent / "fixtures_exempt"
-        finder = MockFileFinder([fixtures_dir / "type_errors.py"])
+        finder = MockFileFinder([type_errors_file])
 
         messages = tool.run(finder)
 
@@ -131,6 +176,21 @@ class TestMypyToolRun:
 
         assert messages == []
 
+    def test_run_passes_paths_after_options(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that file paths follow the output and configured options."""
+        calls: list[list[str]] = []
+
+        def fake_run(args: list[str]) -> tuple[str, str, int]:
+            calls.append(args)
+            return "", "", 0
+
+        monkeypatch.setattr("prospector_extended.tools.mypy_tool.mypy_api.run", fake_run)
+        tool = MypyTool()
+        tool.configure(MockProspectorConfig(), None)
+
+        assert tool.run(MockFileFinder([Path("a.py"), Path("pkg/b.py")])) == []
+        assert calls == [["--output=json", *tool.options, "a.py", str(Path("pkg/b.py"))]]
+
 
 class TestMypyOutputConversion:
     """Tests for mypy output to prospector message conversion."""
@@ -149,7 +209,7 @@ class TestMypyOutputConversion:
             severity="error",
         )
 
-        message = MypyTool._error_to_message(error)
+        message = _error_to_message(error)
 
         assert message is not None
         assert message.source == "mypy"
@@ -169,7 +229,7 @@ class TestMypyOutputConversion:
             severity="note",
         )
 
-        message = MypyTool._error_to_message(error)
+        message = _error_to_message(error)
 
         assert message is None
 
@@ -187,11 +247,30 @@ class TestMypyOutputConversion:
             severity="error",
         )
 
-        message = MypyTool._error_to_message(error)
+        message = _error_to_message(error)
 
         assert message is not None
         assert "Try adding type annotation" in message.message
 
+    def test_path_follows_working_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that relative paths resolve against the current directory, not a cached one."""
+        from prospector_extended.parsing import MypyJsonOutput
+
+        error = MypyJsonOutput(file="test.py", line=1, column=0, message="Error", severity="error")
+        absolute = MypyJsonOutput(file="/abs/test.py", line=1, column=0, message="Error", severity="error")
+
+        original_cwd = Path.cwd()
+        first = _error_to_message(error)
+        monkeypatch.chdir(tmp_path)
+        second = _error_to_message(error)
+
+        assert first is not None
+        assert second is not None
+        assert first.location.path == original_cwd / "test.py"
+        assert second.location.path == tmp_path / "test.py"
+        assert (message := _error_to_message(absolute)) is not None
+        assert message.location.path == Path("/abs/test.py")
+
 
 class TestMypyToolEdgeCases:
     """Error path and edge case tests for MypyTool."""
@@ -237,6 +316,6 @@ class TestMypyToolEdgeCases:
             severity="error",
             code=None,
         )
-        msg = MypyTool._error_to_message(error)
+        msg = _error_to_message(error)
         assert msg is not None
         assert msg.code == "error"
@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from prospector_extended.parsing import (
     AlwaysMatcher,
     DiscriminatorMatcher,
     MypyJsonOutput,
     ParsedRecord,
+    PredicateMatcher,
     RequiredFieldsMatcher,
     TypeRegistry,
     TypeTagMatcher,
     UnparsedLine,
     ValidationFailure,
     compute_fingerprint,
+    get_mypy_json_schema,
     parse_mypy_output,
     parse_mypy_text_line,
     schema_from_fields,
 )
+from prospector_extended.parsing._lines import _scan_lines, iter_lines
 
 
 class TestMypyJsonOutput:
@@ -81,6 +86,26 @@ class TestMypyJsonOutput:
         result = MypyJsonOutput.model_validate(data)
         assert result.column == 0
 
+    def test_frozen(self) -> None:
+        """Test that parsed records can't be modified and are hashable."""
+        output = MypyJsonOutput(file="a.py", line=1, column=0, message="m", severity="error", extra_field="x")
+        with pytest.raises(ValidationError):
+            output.line = 2  # type: ignore[misc]
+        assert hash(output) == hash(output.model_copy())
+
+    def test_json_schema_description_is_stable(self) -> None:
+        """Test that implementation notes stay out of the fingerprinted schema description."""
+        description = get_mypy_json_schema()["description"]
+        assert isinstance(description, str)
+        assert description.startswith("Official mypy JSON output schema")
+        assert "frozen" not in description
+
+    def test_json_schema_copies_are_independent(self) -> None:
+        """Test that mutating a returned schema doesn't affect later calls."""
+        schema = get_mypy_json_schema()
+        schema["title"] = "Mutated"
+        assert get_mypy_json_schema()["title"] == "MypyJsonOutput"
+
 
 class TestMypyTextParsing:
     """Tests for mypy text output parsing."""
@@ -104,6 +129,11 @@ class TestMypyTextParsing:
         assert result.line == 10
         assert result.column == 0
 
+    def test_repeated_line_is_cached(self) -> None:
+        """Test that identical lines reuse the parsed result."""
+        line = "test.py:3: note: See https://mypy.readthedocs.io/ for more info"
+        assert parse_mypy_text_line(line) is parse_mypy_text_line(line)
+
     def test_skip_summary_lines(self) -> None:
         """Test that summary lines are skipped."""
         assert parse_mypy_text_line("Found 3 errors in 1 file") is None
@@ -121,6 +151,24 @@ class TestParseMypyOutput:
         assert len(results) == 1
         assert results[0].file == "test.py"
 
+    def test_json_output_clamps_positions(self) -> None:
+        """Test that the msgspec fast path applies the model's line/column clamps."""
+        stdout = '{"file": "test.py", "line": 0, "column": -1, "message": "Error", "severity": "error", "code": "misc"}'
+        results = parse_mypy_output(stdout)
+        assert len(results) == 1
+        assert isinstance(results[0], MypyJsonOutput)
+        assert results[0].line == 1
+        assert results[0].column == 0
+        assert results[0].code == "misc"
+
+    def test_json_output_falls_back_to_pydantic(self) -> None:
+        """Test that records rejected by the strict decoder are validated by Pydantic."""
+        stdout = '{"file": "test.py", "line": null, "column": null, "message": "Error", "severity": "error"}'
+        results = parse_mypy_output(stdout)
+        assert len(results) == 1
+        assert results[0].line == 1
+        assert results[0].column == 0
+
     def test_mixed_output(self) -> None:
         """Test parsing mixed JSON and text output."""
         stdout = """{"file": "a.py", "line": 1, "column": 0, "message": "JSON error", "severity": "error"}
@@ -130,6 +178,45 @@ Found 2 errors"""
         # Should have 2 errors (JSON and text), summary line skipped
         assert len(results) == 2
 
+    def test_truncated_json_line_skipped(self) -> None:
+        """Test that a truncated JSON line is dropped without affecting neighbours."""
+        truncated = '{"file": "a.py", "line": 1, "column": 0, "message": "Err'
+        complete = '{"file": "b.py", "line": 2, "column": 0, "message": "Ok", "severity": "error"}'
+        stdout = f"{truncated}\n{complete}"
+        results = parse_mypy_output(stdout)
+        assert [r.file for r in results] == ["b.py"]
+
+    def test_malformed_braced_line_skipped(self) -> None:
+        """Test that brace-delimited non-JSON and invalid records fall through to the text parser."""
+        stdout = '{not json}\n{"file": "a.py", "severity": "bogus"}\nb.py:5: error: Text error [misc]'
+        results = parse_mypy_output(stdout)
+        assert [r.file for r in results] == ["b.py"]
+
+    def test_unicode_line_separators_in_messages(self) -> None:
+        """Test that records whose messages contain U+2028, U+2029, \x85 or \x0c are kept whole."""
+        json_record = '{"file": "a.py", "line": 1, "column": 0, "message": "bad\u2028name", "severity": "error"}'
+        text_record = "b.py:2: error: bad\x85name\x0cor\u2029name [misc]"
+        stderr = "mypy: error: bad\u2028config"
+
+        results = parse_mypy_output(f"{json_record}\n{text_record}\n", stderr)
+
+        assert [(r.file, r.message) for r in results] == [
+            ("a.py", "bad\u2028name"),
+            ("b.py", "bad\x85name\x0cor\u2029name"),
+            ("", "mypy: error: bad\u2028config"),
+        ]
+
+    def test_line_iterable_input(self) -> None:
+        """Test that a stream of lines parses the same as the whole string."""
+        stdout = '{"file": "a.py", "line": 1, "column": 0, "message": "JSON error", "severity": "error"}\r\nb.py:5:10: error: Text error [arg-type]\n'
+        assert parse_mypy_output(io.StringIO(stdout, newline="")) == parse_mypy_output(stdout)
+
+    def test_crlf_line_endings(self) -> None:
+        """Test that Windows line endings don't leak into parsed fields."""
+        stdout = "a.py:1: error: First [misc]\r\nb.py:2:3: error: Second [arg-type]\r\n"
+        results = parse_mypy_output(stdout)
+        assert [r.code for r in results] == ["misc", "arg-type"]
+
     def test_stderr_handling(self) -> None:
         """Test that stderr errors are captured."""
         stdout = ""
@@ -138,6 +225,12 @@ Found 2 errors"""
         assert len(results) == 1
         assert results[0].code == "mypy-error"
 
+    def test_stderr_multiple_lines(self) -> None:
+        """Test that each mypy-level stderr line is captured and others ignored."""
+        stderr = "mypy: can't read file 'x.py'\r\n\nTraceback (most recent call last):\nerror: unrecognized arguments\n"
+        results = parse_mypy_output("", stderr)
+        assert [r.message for r in results] == ["mypy: can't read file 'x.py'", "error: unrecognized arguments"]
+
 
 class TestTypeRegistry:
     """Tests for the TypeRegistry."""
@@ -180,6 +273,35 @@ class TestTypeRegistry:
         assert isinstance(warning_result, ParsedRecord)
         assert warning_result.schema_name == "Warning"
 
+    def test_parse_output_keeps_unicode_line_separators(self) -> None:
+        """Test that U+2028 inside a JSON string doesn't split the record."""
+        registry = TypeRegistry().register("Named", schema_from_fields(required={"name": "string"}))
+
+        results = registry.parse_output('{"name": "a\u2028b"}\n{"name": "c\x85d"}\n')
+
+        assert [type(r) for r in results] == [ParsedRecord, ParsedRecord]
+        assert [r.data["name"] for r in results if isinstance(r, ParsedRecord)] == ["a\u2028b", "c\x85d"]
+
+    def test_parse_output_skips_blank_lines(self) -> None:
+        """Test that parse_output and iter_output agree and skip blank lines."""
+        schema = schema_from_fields(required={"name": "string"})
+        registry = TypeRegistry().register("Named", schema)
+
+        output = '\n{"name": "a"}\r\n   \nnot json\n{"name": "b"}\n'
+        results = registry.parse_output(output)
+
+        assert [type(r) for r in results] == [ParsedRecord, UnparsedLine, ParsedRecord]
+        assert list(registry.iter_output(output)) == results
+
+    def test_results_are_slotted(self) -> None:
+        """Test that per-line results carry no instance dict."""
+        registry = TypeRegistry().register("Named", schema_from_fields(required={"name": "string"}))
+
+        results = registry.parse_output('{"name": "a"}\nnot json\n{"name": 1}')
+
+        assert [type(r) for r in results] == [ParsedRecord, UnparsedLine, ValidationFailure]
+        assert not any(hasattr(r, "__dict__") for r in results)
+
     def test_unparsed_line(self) -> None:
         """Test handling of non-JSON lines."""
         registry = TypeRegistry()
@@ -195,6 +317,157 @@ class TestTypeRegistry:
         result = registry.parse_line('{"wrong_field": "value"}')
         assert isinstance(result, ValidationFailure)
 
+    def test_validation_ignores_formats(self) -> None:
+        """Test that format keywords are not enforced, e.g. naive datetimes from pydantic schemas."""
+        schema = schema_from_fields(required={"when": "string"})
+        schema["properties"]["when"]["format"] = "date-time"
+        registry = TypeRegistry().register("Timed", schema)
+
+        result = registry.parse_line('{"when": "2024-01-01T00:00:00"}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "Timed"
+
+    def test_validation_does_not_apply_defaults(self) -> None:
+        """Test that schema defaults are not written into parsed data."""
+        schema = schema_from_fields(required={"name": "string"})
+        schema["properties"]["level"] = {"type": "integer", "default": 0}
+        registry = TypeRegistry().register("Named", schema)
+
+        result = registry.parse_line('{"name": "a"}')
+        assert isinstance(result, ParsedRecord)
+        assert result.data == {"name": "a"}
+
+    def test_validation_errors_are_reported(self) -> None:
+        """Test that validation errors are recorded per attempted schema."""
+        schema = schema_from_fields(required={"required_field": "string"})
+        registry = TypeRegistry().register("Test", schema, AlwaysMatcher())
+
+        result = registry.parse_line('{"required_field": 1}')
+        assert isinstance(result, ValidationFailure)
+        assert result.attempted[0][0] == "Test"
+        assert result.attempted[0][1]
+
+    def test_type_tag_skips_validation(self) -> None:
+        """Test that explicitly tagged records are trusted without validation."""
+        schema = schema_from_fields(required={"value": "integer"})
+        registry = TypeRegistry().register("Tagged", schema, TypeTagMatcher("$type", "Tagged"))
+
+        result = registry.parse_line('{"$type": "Tagged", "value": "not an int"}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "Tagged"
+
+    def test_type_tag_validation_can_be_enabled(self) -> None:
+        """Test that skip_validation=False opts tagged records back in to validation."""
+        schema = schema_from_fields(required={"value": "integer"})
+        registry = TypeRegistry().register("Tagged", schema, TypeTagMatcher("$type", "Tagged"), skip_validation=False)
+
+        invalid = registry.parse_line('{"$type": "Tagged", "value": "not an int"}')
+        valid = registry.parse_line('{"$type": "Tagged", "value": 1}')
+        assert isinstance(invalid, ValidationFailure)
+        assert invalid.attempted[0][0] == "Tagged"
+        assert isinstance(valid, ParsedRecord)
+        assert valid.schema_name == "Tagged"
+
+    def test_indexed_dispatch_preserves_priority(self) -> None:
+        """Test that indexed and linearly-checked schemas are tried in priority order."""
+        schema = schema_from_fields(required={"kind": "string"})
+        registry = TypeRegistry()
+        registry.register("structural", schema, RequiredFieldsMatcher(frozenset({"kind"})))
+        registry.register("discriminated", schema, DiscriminatorMatcher("kind", "a"))
+        registry.register("predicate", schema, PredicateMatcher(lambda d: d.get("kind") == "b", _priority=200))
+
+        for kind, expected in [("a", "discriminated"), ("b", "predicate"), ("c", "structural")]:
+            result = registry.parse_line(json.dumps({"kind": kind}))
+            assert isinstance(result, ParsedRecord)
+            assert result.schema_name == expected
+
+    def test_indexed_dispatch_across_fields(self) -> None:
+        """Test that schemas indexed on different fields are merged in priority order."""
+        strict = schema_from_fields(required={"kind": "string", "level": "integer"})
+        loose = {"type": "object"}
+        registry = TypeRegistry()
+        registry.register("structural", loose, RequiredFieldsMatcher(frozenset({"kind"})))
+        registry.register("by_kind", strict, DiscriminatorMatcher("kind", "a"))
+        registry.register("tagged", strict, TypeTagMatcher("$type", "T"), skip_validation=False)
+
+        result = registry.parse_line('{"$type": "T", "kind": "a", "level": "high"}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "structural"
+
+        result = registry.parse_line('{"$type": "T", "kind": "a", "level": 1}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "tagged"
+
+    def test_unhashable_matcher_values_are_not_indexed(self) -> None:
+        """Test that matchers with unhashable values register and still match by equality."""
+        schema = {"type": "object"}
+        registry = TypeRegistry()
+        registry.register("tagged", schema, TypeTagMatcher("$type", ["a"]))  # type: ignore[arg-type]
+        registry.register("discriminated", schema, DiscriminatorMatcher("kind", ["b"]))
+
+        tagged = registry.parse_line('{"$type": ["a"]}')
+        discriminated = registry.parse_line('{"kind": ["b"]}')
+        assert isinstance(tagged, ParsedRecord)
+        assert tagged.schema_name == "tagged"
+        assert isinstance(discriminated, ParsedRecord)
+        assert discriminated.schema_name == "discriminated"
+
+    def test_indexed_dispatch_with_unhashable_value(self) -> None:
+        """Test that unhashable record values fall through to general matchers."""
+        schema = schema_from_fields(required={"kind": "array"})
+        registry = TypeRegistry()
+        registry.register("discriminated", schema, DiscriminatorMatcher("kind", "a"))
+        registry.register("fallback", schema, AlwaysMatcher())
+
+        result = registry.parse_line('{"kind": ["a"]}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "fallback"
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test that a registry saves as indented JSON and loads with identical schemas and fingerprints."""
+        schema = schema_from_fields(required={"name": "string"}, optional={"tag": "string|null"}, title="Named")
+        registry = TypeRegistry().register("Named", schema).register("Other", {"type": "object"})
+        path = tmp_path / "registry.json"
+
+        registry.save(path)
+        loaded = TypeRegistry.load(path)
+
+        assert path.read_text() == json.dumps(registry.to_dict(), indent=2)
+        assert loaded.to_dict() == registry.to_dict()
+        assert loaded.fingerprints() == registry.fingerprints()
+        assert loaded.fingerprints()["Named"] == compute_fingerprint(schema)
+
+    def test_save_matches_to_dict_after_caller_mutation(self, tmp_path: Path) -> None:
+        """Test that changing a schema dict after register() can't make save() stale."""
+        schema = schema_from_fields(required={"name": "string"})
+        registry = TypeRegistry().register("Named", schema)
+        schema["required"].append("tag")
+        path = tmp_path / "registry.json"
+
+        registry.save(path)
+
+        assert json.loads(path.read_text()) == registry.to_dict()
+        assert registry.to_dict()["schemas"][0]["schema"]["required"] == ["name"]
+
+    def test_validator_compiled_on_first_use(self, tmp_path: Path) -> None:
+        """Test that loading a registry doesn't compile validators until they're needed."""
+        path = tmp_path / "registry.json"
+        TypeRegistry().register("Named", schema_from_fields(required={"name": "string"})).save(path)
+
+        loaded = TypeRegistry.load(path)
+        schema = loaded.get_schema("Named")
+        assert schema is not None
+        assert "_validator" not in vars(schema)
+
+        assert isinstance(loaded.parse_line('{"name": "a"}'), ParsedRecord)
+        assert "_validator" in vars(schema)
+
+    def test_save_empty_registry(self, tmp_path: Path) -> None:
+        """Test that an empty registry saves as valid JSON."""
+        path = tmp_path / "registry.json"
+        TypeRegistry().save(path)
+        assert json.loads(path.read_text()) == {"schemas": []}
+
 
 class TestMatchers:
     """Tests for schema matchers."""
@@ -222,6 +495,18 @@ class TestMatchers:
         assert not matcher.matches({"a": 1})  # Missing b
         assert not matcher.matches({"a": 1, "b": 2, "c": 3})  # Has forbidden c
 
+    def test_required_fields_matcher_accepts_sequences(self) -> None:
+        """Test that RequiredFieldsMatcher built from a tuple and a list matches as with frozensets."""
+        matcher = RequiredFieldsMatcher(required_fields=("a", "b"), forbidden_fields=["c"])  # type: ignore[arg-type]
+        assert matcher.matches({"a": 1, "b": 2})
+        assert not matcher.matches({"a": 1})
+        assert not matcher.matches({"a": 1, "b": 2, "c": 3})
+
+        registry = TypeRegistry().register("Pair", {"type": "object"}, matcher)
+        result = registry.parse_line('{"a": 1, "b": 2}')
+        assert isinstance(result, ParsedRecord)
+        assert result.schema_name == "Pair"
+
 
 class TestUtilities:
     """Tests for utility functions."""
@@ -246,6 +531,32 @@ class TestUtilities:
         assert "count" in schema["required"]
         assert "tag" not in schema["required"]
 
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+    def test_scan_lines_splits_on_newline_only(self, chunk_size: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the chunked scanner breaks lines at "\n" only, whatever the chunking."""
+        monkeypatch.setattr("prospector_extended.parsing._lines._CHUNK_SIZE", chunk_size)
+        cases = {
+            "": [],
+            "a": ["a"],
+            "a\n": ["a"],
+            "a\r\nb\n\nc": ["a", "b", "", "c"],
+            "\n\n": ["", ""],
+            "x\r\ny\r\n": ["x", "y"],
+            "a\rb": ["a\rb"],
+            "\r\r\n": ["\r"],
+            "a\x0bb\x0cc\x1cd\x85e\u2028f\u2029\n": ["a\x0bb\x0cc\x1cd\x85e\u2028f\u2029"],
+        }
+        for text, expected in cases.items():
+            assert list(_scan_lines(text)) == expected
+            assert list(iter_lines(text)) == expected
+
+    def test_iter_lines_streams_large_output(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that outputs above the threshold are scanned instead of split."""
+        monkeypatch.setattr("prospector_extended.parsing._lines.STREAM_THRESHOLD", 4)
+        lines = iter_lines("first\nsecond\n")
+        assert not isinstance(lines, list)
+        assert list(lines) == ["first", "second"]
+
 
 class TestEdgeCases:
     """Error path and edge case tests for parsing."""
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 from prospector.message import Message
 
-from prospector_extended.tools.vulture_tool import ProspectorVultureExtended, VultureTool
+from prospector_extended.tools.vulture_tool import ProspectorVultureExtended, VultureTool, _item_accessors, _read_whitelist
 
 
 @pytest.fixture
@@ -69,6 +71,33 @@ class TestProspectorVultureExtended:
         assert len(v001_messages) == 1
         assert "not found" in v001_messages[0].message.lower()
 
+    def test_item_accessors_support_both_vulture_apis(self):
+        get_file, get_lineno = _item_accessors(SimpleNamespace(file="old.py", lineno=3))
+        assert (get_file(SimpleNamespace(file="a.py", lineno=7)), get_lineno(SimpleNamespace(file="a.py", lineno=7))) == ("a.py", 7)
+
+        new_item = SimpleNamespace(filename="b.py", first_lineno=9)
+        get_file, get_lineno = _item_accessors(new_item)
+        assert (get_file(new_item), get_lineno(new_item)) == ("b.py", 9)
+
+    def test_whitelist_text_cached_until_mtime_changes(self, tmp_path):
+        whitelist = tmp_path / "whitelist.py"
+        whitelist.write_text("first\n")
+        assert _read_whitelist(whitelist) == "first\n"
+
+        stat = whitelist.stat()
+        whitelist.write_text("other\n")
+        os.utime(whitelist, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert _read_whitelist(whitelist) == "first\n"
+
+        os.utime(whitelist, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _read_whitelist(whitelist) == "other\n"
+
+    def test_directory_whitelist_produces_v001(self, mock_file_finder, tmp_path):
+        vulture = ProspectorVultureExtended(mock_file_finder, whitelist_paths=[tmp_path], min_confidence=60)
+        vulture.scavenge()
+        v001_messages = [m for m in vulture.get_messages() if m.code == "V001"]
+        assert len(v001_messages) == 1
+
     def test_message_format(self, mock_file_finder):
         vulture = ProspectorVultureExtended(mock_file_finder, min_confidence=60)
         vulture.scavenge()
@@ -138,3 +167,56 @@ class TestVultureTool:
         messages = tool.run(mock_file_finder)
         for msg in messages:
             assert msg.code not in ["unused-function", "unused-variable"]
+
+    def test_run_reuses_whitelist_scan(self, mock_file_finder, whitelist_fixture_file, monkeypatch):
+        tool = VultureTool()
+        config = MagicMock()
+        config.tool_options.return_value = {"whitelist-paths": [str(whitelist_fixture_file)]}
+        config.get_disabled_messages.return_value = []
+        tool.configure(config, mock_file_finder)
+
+        scans = []
+        original = ProspectorVultureExtended.scan_whitelists
+        monkeypatch.setattr(ProspectorVultureExtended, "scan_whitelists", lambda self: scans.append(1) or original(self))
+
+        first = tool.run(mock_file_finder)
+        second = tool.run(mock_file_finder)
+        assert len(scans) == 1
+        assert [(m.code, m.location.line) for m in second] == [(m.code, m.location.line) for m in first]
+
+        config.tool_options.return_value = {}
+        tool.configure(config, mock_file_finder)
+        tool.run(mock_file_finder)
+        assert len(scans) == 2
+
+    def test_run_reuses_whitelist_scan_across_path_spellings(self, mock_file_finder, whitelist_fixture_file, monkeypatch):
+        tool = VultureTool()
+        config = MagicMock()
+        config.get_disabled_messages.return_value = []
+        scans = []
+        original = ProspectorVultureExtended.scan_whitelists
+        monkeypatch.setattr(ProspectorVultureExtended, "scan_whitelists", lambda self: scans.append(1) or original(self))
+
+        config.tool_options.return_value = {"whitelist-paths": [str(whitelist_fixture_file.absolute())]}
+        tool.configure(config, mock_file_finder)
+        tool.run(mock_file_finder)
+        config.tool_options.return_value = {"whitelist-paths": [os.path.relpath(whitelist_fixture_file)]}
+        tool.configure(config, mock_file_finder)
+        tool.run(mock_file_finder)
+        assert len(scans) == 1
+
+    def test_run_rescans_when_state_unavailable(self, mock_file_finder, whitelist_fixture_file, monkeypatch):
+        monkeypatch.setattr("prospector_extended.tools.vulture_tool._SCAN_STATE_ATTRS", ("defined_funcs", "not_a_vulture_attr"))
+        tool = VultureTool()
+        config = MagicMock()
+        config.tool_options.return_value = {"whitelist-paths": [str(whitelist_fixture_file)]}
+        config.get_disabled_messages.return_value = []
+        tool.configure(config, mock_file_finder)
+        scans = []
+        original = ProspectorVultureExtended.scan_whitelists
+        monkeypatch.setattr(ProspectorVultureExtended, "scan_whitelists", lambda self: scans.append(1) or original(self))
+
+        first = tool.run(mock_file_finder)
+        second = tool.run(mock_file_finder)
+        assert len(scans) == 2
+        assert [(m.code, m.location.line) for m in second] == [(m.code, m.location.line) for m in first]